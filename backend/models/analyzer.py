@@ -1,10 +1,15 @@
 # backend/models/analyzer.py
 import ast
 import re
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from operator import attrgetter
+from typing import List, Dict, Any, Set, Tuple
+from dataclasses import dataclass, field
 
-@dataclass
+# Naming convention patterns, compiled once for every function and class checked
+_is_snake_case = re.compile(r'^[a-z_][a-z0-9_]*$').match
+_is_pascal_case = re.compile(r'^[A-Z][a-zA-Z0-9]*$').match
+
+@dataclass(slots=True)
 class CodeIssue:
     line_number: int
     issue_type: str
@@ -12,27 +17,226 @@ class CodeIssue:
     message: str
     suggestion: str = ""
 
-class PythonCodeAnalyzer:
-    def __init__(self):
-        self.issues = []
+def _count_boolops(node: ast.AST, limit: int) -> int:
+    """Count boolean operators under node, stopping once limit is reached"""
+    count = 0
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if isinstance(n, (ast.And, ast.Or)):
+            count += 1
+            if count >= limit:
+                return count
+        stack.extend(ast.iter_child_nodes(n))
+    return count
+
+@dataclass(slots=True)
+class _NodeIndex:
+    """Nodes of a tree grouped by the checks that need them"""
+    functions: List[ast.FunctionDef] = field(default_factory=list)
+    # Functions and classes together, in walk order
+    definitions: List[ast.AST] = field(default_factory=list)
+    ifs: List[ast.If] = field(default_factory=list)
+    # (line number, imported name, name the import binds)
+    imports: List[Tuple[int, str, str]] = field(default_factory=list)
+    used_names: Set[str] = field(default_factory=set)
+
+def _add_exports(value: ast.AST, used_names: Set[str]):
+    """Count names re-exported through __all__ as used"""
+    if type(value) is ast.List or type(value) is ast.Tuple:
+        for element in value.elts:
+            if type(element) is ast.Constant and type(element.value) is str:
+                used_names.add(element.value)
+
+def _index_nodes(tree: ast.AST) -> _NodeIndex:
+    """Sort the nodes every check needs into lists in a single walk"""
+    index = _NodeIndex()
+    functions, definitions, ifs, imports = index.functions, index.definitions, index.ifs, index.imports
+    used_names = index.used_names
     
-    def analyze_code(self, code: str) -> Dict[str, Any]:
-        """Main analysis function that returns structured feedback"""
-        self.issues = []
+    # Exact type checks are cheaper than isinstance; names come first since
+    # they are by far the most common nodes
+    for node in ast.walk(tree):
+        node_type = type(node)
+        if node_type is ast.Name:
+            used_names.add(node.id)
+        elif node_type is ast.Attribute:
+            used_names.add(node.attr)
+        elif node_type is ast.FunctionDef:
+            functions.append(node)
+            definitions.append(node)
+        elif node_type is ast.ClassDef:
+            definitions.append(node)
+        elif node_type is ast.If:
+            ifs.append(node)
+        elif node_type is ast.Import:
+            for alias in node.names:
+                name = alias.name.split('.')[0]
+                imports.append((node.lineno, name, alias.asname or name))
+        elif node_type is ast.ImportFrom:
+            for alias in node.names:
+                imports.append((node.lineno, alias.name, alias.asname or alias.name))
+        elif node_type is ast.Assign:
+            if any(type(t) is ast.Name and t.id == '__all__' for t in node.targets):
+                _add_exports(node.value, used_names)
+        elif node_type is ast.AugAssign or node_type is ast.AnnAssign:
+            if type(node.target) is ast.Name and node.target.id == '__all__':
+                _add_exports(node.value, used_names)
+    
+    return index
+
+def _check_function_length(functions: List[ast.FunctionDef]) -> List[CodeIssue]:
+    """Check for overly long functions"""
+    issues = []
+    
+    for node in functions:
+        # Calculate function length
+        end_line = node.end_lineno or node.lineno
+        func_length = end_line - node.lineno + 1
         
+        if func_length > 50:
+            issues.append(CodeIssue(
+                line_number=node.lineno,
+                issue_type="function_length",
+                severity="warning",
+                message=f"Function '{node.name}' is {func_length} lines long",
+                suggestion="Consider breaking this function into smaller functions"
+            ))
+        elif func_length > 20:
+            issues.append(CodeIssue(
+                line_number=node.lineno,
+                issue_type="function_length",
+                severity="info",
+                message=f"Function '{node.name}' is {func_length} lines long",
+                suggestion="Consider if this function could be simplified"
+            ))
+    
+    return issues
+
+def _check_missing_docstrings(definitions: List[ast.AST]) -> List[CodeIssue]:
+    """Check for missing docstrings in functions and classes"""
+    issues = []
+    
+    for node in definitions:
+        if ast.get_docstring(node, clean=False) is None:
+            node_type = "function" if type(node) is ast.FunctionDef else "class"
+            issues.append(CodeIssue(
+                line_number=node.lineno,
+                issue_type="missing_docstring",
+                severity="info",
+                message=f"{node_type.title()} '{node.name}' is missing a docstring",
+                suggestion=f"Add a docstring to document what this {node_type} does"
+            ))
+    
+    return issues
+
+def _check_unused_imports(imports: List[Tuple[int, str, str]], used_names: Set[str]) -> List[CodeIssue]:
+    """Check for potentially unused imports (simple heuristic)"""
+    # Simple check: if import name isn't referenced anywhere in the code
+    return [
+        CodeIssue(
+            line_number=line_number,
+            issue_type="unused_import",
+            severity="info",
+            message=f"Import '{import_name}' appears to be unused",
+            suggestion="Remove unused imports to keep code clean"
+        )
+        for line_number, import_name, bound_name in imports
+        if bound_name not in used_names
+    ]
+
+def _check_complex_conditions(ifs: List[ast.If]) -> List[CodeIssue]:
+    """Check for overly complex conditional statements"""
+    issues = []
+    
+    for node in ifs:
+        # Count boolean operators in the condition only
+        if _count_boolops(node.test, limit=4) > 3:
+            issues.append(CodeIssue(
+                line_number=node.lineno,
+                issue_type="complex_condition",
+                severity="warning",
+                message="Complex conditional statement with multiple boolean operators",
+                suggestion="Consider breaking this into multiple conditions or using a helper function"
+            ))
+    
+    return issues
+
+def _check_naming_conventions(definitions: List[ast.AST]) -> List[CodeIssue]:
+    """Check Python naming conventions"""
+    issues = []
+    
+    for node in definitions:
+        if type(node) is ast.FunctionDef:
+            # Function names should be snake_case
+            if not _is_snake_case(node.name) and not node.name.startswith('__'):
+                issues.append(CodeIssue(
+                    line_number=node.lineno,
+                    issue_type="naming_convention",
+                    severity="info",
+                    message=f"Function '{node.name}' doesn't follow snake_case convention",
+                    suggestion="Use snake_case for function names (e.g., my_function)"
+                ))
+        
+        else:
+            # Class names should be PascalCase
+            if not _is_pascal_case(node.name):
+                issues.append(CodeIssue(
+                    line_number=node.lineno,
+                    issue_type="naming_convention",
+                    severity="info",
+                    message=f"Class '{node.name}' doesn't follow PascalCase convention",
+                    suggestion="Use PascalCase for class names (e.g., MyClass)"
+                ))
+    
+    return issues
+
+def count_lines(code: str) -> int:
+    """Count lines without splitting the code into a list of strings"""
+    return code.count('\n') + (0 if code.endswith('\n') else 1)
+
+# Weighted scoring based on severity
+_SEVERITY_WEIGHTS = {
+    "error": -20,
+    "warning": -10, 
+    "info": -5
+}
+
+def _calculate_quality_score(issues: List[CodeIssue]) -> float:
+    """Calculate overall quality score from 0-100"""
+    if not issues:
+        return 100.0
+    
+    # map() keeps the whole tally in C, with no generator frame per issue
+    total_deduction = sum(map(_SEVERITY_WEIGHTS.__getitem__, map(attrgetter('severity'), issues)))
+    
+    # Start with 100 and apply deductions
+    score = max(0, 100 + total_deduction)
+    
+    return round(float(score), 1)
+
+class PythonCodeAnalyzer:
+    @staticmethod
+    def analyze_code(code: str) -> Dict[str, Any]:
+        """Main analysis function that returns structured feedback"""
         try:
             # Parse the code into an AST
             tree = ast.parse(code)
             
-            # Run various analysis checks
-            self._check_function_length(tree, code)
-            self._check_missing_docstrings(tree)
-            self._check_unused_imports(tree, code)
-            self._check_complex_conditions(tree)
-            self._check_naming_conventions(tree)
+            # Index the tree once, then run each check over just the nodes it
+            # needs; nothing is stored on the analyzer, so concurrent calls
+            # don't interfere
+            index = _index_nodes(tree)
+            issues = [
+                *_check_function_length(index.functions),
+                *_check_missing_docstrings(index.definitions),
+                *_check_unused_imports(index.imports, index.used_names),
+                *_check_complex_conditions(index.ifs),
+                *_check_naming_conventions(index.definitions),
+            ]
             
             # Calculate overall quality score
-            quality_score = self._calculate_quality_score()
+            quality_score = _calculate_quality_score(issues)
             
             return {
                 "quality_score": quality_score,
@@ -44,15 +248,15 @@ class PythonCodeAnalyzer:
                         "message": issue.message,
                         "suggestion": issue.suggestion
                     }
-                    for issue in self.issues
+                    for issue in issues
                 ],
-                "total_issues": len(self.issues),
-                "lines_of_code": len(code.split('\n'))
+                "total_issues": len(issues),
+                "lines_of_code": count_lines(code)
             }
             
         except SyntaxError as e:
             return {
-                "quality_score": 0,
+                "quality_score": 0.0,
                 "issues": [{
                     "line": e.lineno or 1,
                     "type": "syntax_error",
@@ -61,149 +265,5 @@ class PythonCodeAnalyzer:
                     "suggestion": "Fix the syntax error before analysis can continue"
                 }],
                 "total_issues": 1,
-                "lines_of_code": len(code.split('\n'))
-            }
-    
-    def _check_function_length(self, tree: ast.AST, code: str):
-        """Check for overly long functions"""
-        lines = code.split('\n')
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Calculate function length
-                end_line = node.end_lineno or node.lineno
-                func_length = end_line - node.lineno + 1
-                
-                if func_length > 50:
-                    self.issues.append(CodeIssue(
-                        line_number=node.lineno,
-                        issue_type="function_length",
-                        severity="warning",
-                        message=f"Function '{node.name}' is {func_length} lines long",
-                        suggestion="Consider breaking this function into smaller functions"
-                    ))
-                elif func_length > 20:
-                    self.issues.append(CodeIssue(
-                        line_number=node.lineno,
-                        issue_type="function_length",
-                        severity="info",
-                        message=f"Function '{node.name}' is {func_length} lines long",
-                        suggestion="Consider if this function could be simplified"
-                    ))
-    
-    def _check_missing_docstrings(self, tree: ast.AST):
-        """Check for missing docstrings in functions and classes"""
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                # Check if first statement is a docstring
-                has_docstring = (
-                    node.body and 
-                    isinstance(node.body[0], ast.Expr) and 
-                    isinstance(node.body[0].value, ast.Constant) and
-                    isinstance(node.body[0].value.value, str)
-                )
-                
-                if not has_docstring:
-                    node_type = "function" if isinstance(node, ast.FunctionDef) else "class"
-                    self.issues.append(CodeIssue(
-                        line_number=node.lineno,
-                        issue_type="missing_docstring",
-                        severity="info",
-                        message=f"{node_type.title()} '{node.name}' is missing a docstring",
-                        suggestion=f"Add a docstring to document what this {node_type} does"
-                    ))
-    
-    def _check_unused_imports(self, tree: ast.AST, code: str):
-        """Check for potentially unused imports (simple heuristic)"""
-        imports = []
-        
-        # Collect all imports
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name.split('.')[0])
-            elif isinstance(node, ast.ImportFrom):
-                for alias in node.names:
-                    imports.append(alias.name)
-        
-        # Simple check: if import name doesn't appear elsewhere in code
-        for import_name in imports:
-            # Count occurrences (excluding import statements)
-            import_pattern = rf'\b{re.escape(import_name)}\b'
-            matches = re.findall(import_pattern, code)
-            
-            # If only appears once (in the import), might be unused
-            if len(matches) <= 1:
-                # Find line number of import
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.Import, ast.ImportFrom)):
-                        names = [alias.name for alias in node.names]
-                        if import_name in names:
-                            self.issues.append(CodeIssue(
-                                line_number=node.lineno,
-                                issue_type="unused_import",
-                                severity="info",
-                                message=f"Import '{import_name}' appears to be unused",
-                                suggestion="Remove unused imports to keep code clean"
-                            ))
-                            break
-    
-    def _check_complex_conditions(self, tree: ast.AST):
-        """Check for overly complex conditional statements"""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.If):
-                # Count boolean operators in condition
-                bool_ops = len([n for n in ast.walk(node.test) if isinstance(n, (ast.And, ast.Or))])
-                
-                if bool_ops > 3:
-                    self.issues.append(CodeIssue(
-                        line_number=node.lineno,
-                        issue_type="complex_condition",
-                        severity="warning",
-                        message="Complex conditional statement with multiple boolean operators",
-                        suggestion="Consider breaking this into multiple conditions or using a helper function"
-                    ))
-    
-    def _check_naming_conventions(self, tree: ast.AST):
-        """Check Python naming conventions"""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Function names should be snake_case
-                if not re.match(r'^[a-z_][a-z0-9_]*$', node.name) and not node.name.startswith('__'):
-                    self.issues.append(CodeIssue(
-                        line_number=node.lineno,
-                        issue_type="naming_convention",
-                        severity="info",
-                        message=f"Function '{node.name}' doesn't follow snake_case convention",
-                        suggestion="Use snake_case for function names (e.g., my_function)"
-                    ))
-            
-            elif isinstance(node, ast.ClassDef):
-                # Class names should be PascalCase
-                if not re.match(r'^[A-Z][a-zA-Z0-9]*$', node.name):
-                    self.issues.append(CodeIssue(
-                        line_number=node.lineno,
-                        issue_type="naming_convention",
-                        severity="info",
-                        message=f"Class '{node.name}' doesn't follow PascalCase convention",
-                        suggestion="Use PascalCase for class names (e.g., MyClass)"
-                    ))
-    
-    def _calculate_quality_score(self) -> float:
-        """Calculate overall quality score from 0-100"""
-        if not self.issues:
-            return 100.0
-        
-        # Weighted scoring based on severity
-        severity_weights = {
-            "error": -20,
-            "warning": -10, 
-            "info": -5
-        }
-        
-        total_deduction = sum(severity_weights[issue.severity] for issue in self.issues)
-        
-        # Start with 100 and apply deductions
-        score = max(0, 100 + total_deduction)
-        
-        return round(score, 1)
\ No newline at end of file
+                "lines_of_code": count_lines(code)
+            }
\ No newline at end of file
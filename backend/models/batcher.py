@@ -0,0 +1,106 @@
+# backend/models/batcher.py
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Optional, Tuple
+from backend.models.analyzer import PythonCodeAnalyzer
+
+def _analyze(code: str) -> Dict[str, Any]:
+    """Analyze one submission inside a worker process"""
+    return PythonCodeAnalyzer.analyze_code(code)
+
+class AnalysisBatcher:
+    """
+    Queues analysis requests and hands each one to a process pool as soon
+    as it is dequeued, so analyses aren't serialized on the GIL of the API
+    process.
+
+    max_batch_size caps how many analyses are in the pool at once. It
+    defaults to the worker count, so everything that has been submitted is
+    actually running. If a worker dies, only the analyses that were running
+    on it fail; the pool is replaced and later requests are served normally.
+    """
+
+    def __init__(self, max_batch_size: Optional[int] = None, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count()
+        self.max_batch_size = max_batch_size or self.max_workers
+        self._queue: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the worker pool and the dispatch loop"""
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_batch_size)
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop dispatching and shut down the worker pool"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def analyze(self, code: str) -> Dict[str, Any]:
+        """Queue code for analysis and wait for its result"""
+        if self._task is None or self._task.done():
+            raise RuntimeError("AnalysisBatcher is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((code, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            code, future = await self._queue.get()
+            await self._slots.acquire()
+
+            # The request may have been cancelled while it was queued
+            if future.done():
+                self._slots.release()
+                continue
+
+            try:
+                self._submit(code, future)
+            except Exception as e:
+                self._slots.release()
+                future.set_exception(e)
+
+    def _submit(self, code: str, future: asyncio.Future):
+        loop = asyncio.get_running_loop()
+        try:
+            result = loop.run_in_executor(self._pool, _analyze, code)
+        except BrokenProcessPool:
+            # A worker died since the last submission. This analysis never
+            # ran, so run it on a fresh pool instead of failing it.
+            self._restart_pool()
+            result = loop.run_in_executor(self._pool, _analyze, code)
+        result.add_done_callback(lambda done: self._resolve(done, future))
+
+    def _restart_pool(self):
+        """Replace a broken worker pool with a fresh one"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _resolve(self, done: asyncio.Future, future: asyncio.Future):
+        """Hand a finished analysis back to the waiting request"""
+        self._slots.release()
+
+        # The request may have been cancelled while it was running
+        if future.done():
+            return
+        if done.cancelled():
+            future.cancel()
+        elif done.exception() is not None:
+            future.set_exception(done.exception())
+        else:
+            future.set_result(done.result())
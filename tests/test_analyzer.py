@@ -0,0 +1,27 @@
+# tests/test_analyzer.py
+from backend.models.analyzer import PythonCodeAnalyzer
+
+def _unused_imports(code: str):
+    result = PythonCodeAnalyzer.analyze_code(code)
+    return [issue["message"] for issue in result["issues"] if issue["type"] == "unused_import"]
+
+def test_aliased_import_is_looked_up_by_alias():
+    assert _unused_imports("import pandas as pd\npd.DataFrame()\n") == []
+    assert _unused_imports("from os import path as p\np.join('a')\n") == []
+
+def test_unused_aliased_import_reports_imported_name():
+    assert _unused_imports("import pandas as pd\n") == ["Import 'pandas' appears to be unused"]
+
+def test_dotted_import_binds_top_level_package():
+    assert _unused_imports("import os.path\nos.getcwd()\n") == []
+
+def test_all_reexports_count_as_used():
+    code = 'from .core import Engine, Helper\n__all__ = ["Engine"]\n__all__ += ("Helper",)\n'
+    assert _unused_imports(code) == []
+
+def test_unused_import_is_flagged():
+    assert _unused_imports("import os\nimport sys\nsys.exit()\n") == ["Import 'os' appears to be unused"]
+
+def test_quality_score_is_always_a_float():
+    for code in ("x = 1\n", "import os\n", "def f(:\n"):
+        assert type(PythonCodeAnalyzer.analyze_code(code)["quality_score"]) is float
@@ -0,0 +1,100 @@
+# tests/test_batcher.py
+import asyncio
+import os
+import signal
+import sys
+import time
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+from backend.models import batcher as batcher_module
+from backend.models.batcher import AnalysisBatcher
+
+# Stand-ins for the worker function; they live at module level so the pool
+# can pickle them by reference
+def _slow_pid(code: str) -> int:
+    time.sleep(0.2)
+    return os.getpid()
+
+def _fail_on_bad(code: str) -> str:
+    if code == "bad":
+        raise ValueError("bad submission")
+    return code
+
+def _kill_worker(code: str) -> str:
+    if code == "crash":
+        os.kill(os.getpid(), signal.SIGKILL)
+    return code
+
+def _run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=30))
+
+def test_analyze_returns_analyzer_result():
+    async def scenario():
+        batcher = AnalysisBatcher(max_workers=2)
+        await batcher.start()
+        try:
+            return await batcher.analyze("import os\n")
+        finally:
+            await batcher.stop()
+
+    result = _run(scenario())
+    assert result["total_issues"] == 1
+    assert result["issues"][0]["type"] == "unused_import"
+
+def test_submissions_fan_out_across_workers(monkeypatch):
+    monkeypatch.setattr(batcher_module, "_analyze", _slow_pid)
+
+    async def scenario():
+        batcher = AnalysisBatcher(max_workers=4)
+        await batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.analyze(str(i)) for i in range(8)))
+        finally:
+            await batcher.stop()
+
+    pids = _run(scenario())
+    assert len(set(pids)) > 1
+
+def test_failing_submission_does_not_fail_others(monkeypatch):
+    monkeypatch.setattr(batcher_module, "_analyze", _fail_on_bad)
+
+    async def scenario():
+        batcher = AnalysisBatcher(max_workers=2)
+        await batcher.start()
+        try:
+            codes = ["a", "bad", "b"]
+            return await asyncio.gather(*(batcher.analyze(c) for c in codes), return_exceptions=True)
+        finally:
+            await batcher.stop()
+
+    good_a, bad, good_b = _run(scenario())
+    assert (good_a, good_b) == ("a", "b")
+    assert isinstance(bad, ValueError)
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs SIGKILL")
+def test_recovers_after_worker_dies(monkeypatch):
+    monkeypatch.setattr(batcher_module, "_analyze", _kill_worker)
+
+    async def scenario():
+        batcher = AnalysisBatcher(max_workers=2)
+        await batcher.start()
+        try:
+            with pytest.raises(BrokenProcessPool):
+                await batcher.analyze("crash")
+
+            # Nothing else was running on the dead pool, so the next
+            # request must not fail
+            return await batcher.analyze("innocent")
+        finally:
+            assert not batcher._task.done()
+            await batcher.stop()
+
+    assert _run(scenario()) == "innocent"
+
+def test_analyze_requires_running_batcher():
+    async def scenario():
+        batcher = AnalysisBatcher(max_workers=1)
+        with pytest.raises(RuntimeError):
+            await batcher.analyze("x = 1\n")
+
+    _run(scenario())
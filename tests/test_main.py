@@ -0,0 +1,47 @@
+# tests/test_main.py
+import pytest
+from fastapi.testclient import TestClient
+from backend import main
+from backend.main import app, MAX_CODE_LENGTH, MAX_CODE_LINES
+
+@pytest.fixture(scope="module")
+def client():
+    # Entering the client runs the lifespan, which starts the batcher
+    with TestClient(app) as client:
+        yield client
+
+def _analyze(client, code: str):
+    return client.post("/analyze", json={"code": code})
+
+def test_accepts_exactly_max_lines(client):
+    response = _analyze(client, "x = 1\n" * MAX_CODE_LINES)
+    assert response.status_code == 200
+    assert response.json()["lines_of_code"] == MAX_CODE_LINES
+
+def test_rejects_one_line_over_max(client):
+    response = _analyze(client, "x = 1\n" * (MAX_CODE_LINES + 1))
+    assert response.status_code == 413
+
+def test_rejects_code_over_max_length(client):
+    response = _analyze(client, "#" * (MAX_CODE_LENGTH + 1))
+    assert response.status_code == 413
+
+def test_rejects_whitespace_only_code(client):
+    response = _analyze(client, " \n\t\n")
+    assert response.status_code == 400
+
+def test_identical_submissions_reuse_cached_result(client):
+    code = "import os\n"
+    first = _analyze(client, code)
+    cached = len(main._analysis_cache)
+    second = _analyze(client, code)
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert len(main._analysis_cache) == cached
+    assert first.json()["quality_score"] == 95.0
+
+def test_demo_serves_precomputed_analysis(client):
+    response = client.get("/analyze/demo")
+    assert response.status_code == 200
+    assert response.json()["sample_code"] == main.SAMPLE_CODE